@@ -1,2 +1 @@
-from .semver import SemverThing, NotSemanticVersion
-
+from .semver import SemverThing, NotSemanticVersion, sort_semvers
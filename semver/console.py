@@ -1,9 +1,37 @@
 "Supplies the 'semver' command line tool as defined in setup.py (entry_points)."
 
+import os
+import sys
 import fileinput
+from itertools import chain, islice
+from multiprocessing import Pool
 
 from .semver import SemverThing, NotSemanticVersion
 
+# number of answers main() collects before writing them out in one go.
+OUTPUT_BATCH_SIZE = 1024
+
+# when this process can use more than one CPU, input past this many lines is farmed out
+# to a pool of worker processes, PARALLEL_CHUNKSIZE lines at a time.  (Smaller inputs aren't
+# worth the startup cost, the shipping of lines and answers between processes, or the
+# workers' cold parse caches.)
+PARALLEL_THRESHOLD = 100000
+PARALLEL_CHUNKSIZE = 4096
+
+
+def usable_cpu_count():
+    """Returns the number of CPUs this process may actually run on, which under taskset,
+    a restricted CPU affinity or a container's CPU limit can be fewer than the host has.
+
+    :return: CPU count (at least 1)
+    :rtype: int
+    """
+    if hasattr(os, 'process_cpu_count'):
+        # python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
 
 
 def compare_versions(vstr1, vstr2):
@@ -18,22 +46,69 @@ def compare_versions(vstr1, vstr2):
     :return: answer (str)
     :rtype: str
     """
+    # SemverThing() would give a blank slate for empty (or other falsy) input, not an error.
+    if not vstr1 or not vstr2:
+        return 'invalid'
+
+    # identical strings are equal as long as they're valid, which takes only one parse to find out.
+    # (SemverThing(text) memoizes the parse itself, so repeated strings stay cheap.  Each call
+    # gets its own object, rather than the shared ones from_string hands out, so nothing a
+    # library caller does to those can change the answers here.)
+    if vstr1 == vstr2:
+        try:
+            SemverThing(vstr1)
+        except NotSemanticVersion:
+            return 'invalid'
+        return 'equal'
+
     try:
         sv1 = SemverThing(vstr1)
         sv2 = SemverThing(vstr2)
     except NotSemanticVersion:
         return 'invalid'
 
-    try:
-        if sv1 < sv2:
-            return 'before'
-        elif sv1 > sv2:
-            return 'after'
-        elif sv1 == sv2:
-            return 'equal'
-    except TypeError:
-        # attempt to compare SemverThing in which one or more properties are None
-        return 'invalid'
+    # both were parsed from text, so neither is missing a number and these comparisons can't fail.
+    if sv1 < sv2:
+        return 'before'
+    elif sv1 > sv2:
+        return 'after'
+    return 'equal'
+
+
+def compare_line(line):
+    """Produces the output for one line of input to the "semver" tool: the answer from
+    compare_versions followed by a newline, "invalid" if the line doesn't hold exactly
+    2 words, or an empty string for blank lines (which are ignored).
+
+    :param line: line of input text
+    :return: output text for this line
+    :rtype: str
+    """
+    words = line.split()
+
+    # blank line: skip it silently
+    if not words:
+        return ''
+
+    # too many or not enough items on this line: invalid
+    if len(words) != 2:
+        return 'invalid\n'
+
+    # now we should have 2 words to compare.
+    return compare_versions(words[0], words[1]) + '\n'
+
+
+def _write_batched(outputs):
+    "Writes out the iterable of output strings, OUTPUT_BATCH_SIZE of them at a time."
+    write = sys.stdout.write
+    buf = []
+    append = buf.append
+    for out in outputs:
+        append(out)
+        if len(buf) >= OUTPUT_BATCH_SIZE:
+            write(''.join(buf))
+            buf.clear()
+    write(''.join(buf))
 
 
 def main():
@@ -51,24 +126,27 @@ def main():
     than 2 strings, or contain only 1 string.  Output will be "invalid" for these lines.
 
     Whitespace lines are ignored.
+
+    With more than one usable CPU, any lines beyond the first PARALLEL_THRESHOLD are
+    spread across one worker process per CPU; the output still comes out in input order.
     """
 
     # The fileinput.input() function either takes piped input, or looks for a filename
-    # and tries to open it and read it line by line.
-    for line in fileinput.input():
-        #print()    #debug
-        #print(line.strip())        #debug
-        words = line.strip().split()
-
-        # blank line: skip it silently
-        if len(words)==0:
-            continue
-        
-        # too many or not enough items on this line: invalid
-        if len(words) > 2 or len(words) == 1:
-            print('invalid')
-            continue
-
-        # now we should have 2 words to compare.
-        print(compare_versions(words[0], words[1]))
-
+    # and tries to open it and read it line by line (lazily, so large inputs stream through).
+    lines = fileinput.input()
+
+    # with a single CPU, worker processes only add overhead.
+    ncpu = usable_cpu_count()
+    if ncpu < 2:
+        _write_batched(map(compare_line, lines))
+        return
+
+    # the first PARALLEL_THRESHOLD lines are answered here, streaming out as usual; the
+    # pool is only started if the input turns out to be longer than that.
+    _write_batched(map(compare_line, islice(lines, PARALLEL_THRESHOLD)))
+    line = next(lines, None)
+    if line is None:
+        return
+
+    with Pool(ncpu) as pool:
+        _write_batched(pool.imap(compare_line, chain([line], lines), PARALLEL_CHUNKSIZE))
@@ -2,45 +2,118 @@
 """
 
 import re
+import sys
+from functools import lru_cache, total_ordering
+from operator import attrgetter
 
 # regular expression for parsing semantic version text as per semver 2.0 documentation
-re_semver = re.compile('^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$')
+# (alternations are ordered most-common-first to cut down on backtracking.)
+#
+# The pattern is unanchored and meant to be used with fullmatch().  ASCII mode keeps \d
+# from accepting non-ASCII digits, which the semver grammar doesn't allow.
+re_semver = re.compile(r'(?P<major>[1-9]\d*|0)\.(?P<minor>[1-9]\d*|0)\.(?P<patch>[1-9]\d*|0)(?:-(?P<prerelease>(?:\d*[a-zA-Z-][0-9a-zA-Z-]*|[1-9]\d*|0)(?:\.(?:\d*[a-zA-Z-][0-9a-zA-Z-]*|[1-9]\d*|0))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?', re.ASCII)
+
+# the same pattern, matching whole lines of a newline-separated batch (see SemverThing.parse_many).
+re_semver_lines = re.compile(r'^(?:{})$'.format(re_semver.pattern), re.ASCII | re.MULTILINE)
 
 # regular expression helpful for breaking 2 prerelease strings into symmetric parts.
-re_prerelease = re.compile('^(?P<abc>[a-zA-Z]*)(?P<num>([-.\d]*)?)')
+re_prerelease = re.compile(r'^(?P<abc>[a-zA-Z]*)(?P<num>([-.\d]*)?)')
+
+# longest version string we're willing to parse (the same limit npm's semver package uses).
+MAX_LENGTH = 256
 
 class NotSemanticVersion(Exception):
     "Raised when supplied string fails to parse into semantic version information during parse_semver_text."
     pass
 
 
+def _fast_parse_semver_text(text):
+    """Straight-line parser for the most common shape of version string, a bare
+    "major.minor.patch", using only a handful of string methods.
+
+    Returns None for anything else (including any text with a prerelease or build
+    section); the caller should then consult re_semver for the definitive answer.
+    For those longer strings a single pass of the regular expression beats picking
+    the text apart piece by piece in Python.
+
+    :param text: (str)
+    :return: components of the semantic version (or None)
+    :rtype: dict
+    """
+    if '-' in text or '+' in text:
+        return None
+
+    parts = text.split('.')
+    if len(parts) != 3 or not text.isascii():
+        return None
+
+    # all three numbers must be non-empty and all digits, without leading zeroes.
+    major, minor, patch = parts
+    if not (major and minor and patch and (major + minor + patch).isdigit()):
+        return None
+    if ((major[0] == '0' and major != '0') or (minor[0] == '0' and minor != '0')
+            or (patch[0] == '0' and patch != '0')):
+        return None
+
+    return {'major': int(major),
+            'minor': int(minor),
+            'patch': int(patch),
+            'prerelease': None,
+            'buildmetadata': None,
+           }
+
+
 def parse_semver_text(text):
-    """Uses regular expression to parse out the components of a semantic version string.
+    """Parses out the components of a semantic version string.
     
-    If regular expression parsing fails, raises NotSemanticVersion exception.
+    Bare "major.minor.patch" strings are handled by a fast straight-line parser;
+    anything else is handed to the full regular expression (re_semver).
+    If the text is too short, longer than MAX_LENGTH, or fails regular expression parsing,
+    raises NotSemanticVersion exception.
 
     The dictionary returned should contain the following keys if successful:
 
-        major
-        minor
-        patch
-        prerelease
-        buildmetadata
+        major           (int)
+        minor           (int)
+        patch           (int)
+        prerelease      (str, or None if absent)
+        buildmetadata   (str, or None if absent)
 
     :param text: (str)
-    :return: match group from regular expression (if successful)
+    :return: components of the semantic version (if successful)
     :rtype: dict
     :raises: NotSemanticVersion
     """
-    res = re_semver.match(text)
+    if not isinstance(text, str):
+        raise NotSemanticVersion('{} is not a valid string.'.format(text))
+
+    # cheap checks that rule out obvious garbage before any real parsing is done
+    # (nothing shorter than "0.0.0" can be a version).
+    if len(text) < 5 or len(text) > MAX_LENGTH or not text[0].isdigit() or text.count('.') < 2:
+        raise NotSemanticVersion('Supplied text "{}" is not shaped like a semantic version.'.format(text))
+
+    parsed = _fast_parse_semver_text(text)
+    if parsed is not None:
+        return parsed
+
+    res = re_semver.fullmatch(text)
     if not res:
         raise NotSemanticVersion('Supplied text "{}" did not pass regular expression parsing.'.format(text))
-    return res.groupdict()
+    parsed = res.groupdict()
+    parsed['major'] = int(parsed['major'])
+    parsed['minor'] = int(parsed['minor'])
+    parsed['patch'] = int(parsed['patch'])
+    return parsed
 
 
+# rec_cmp_releases, rec_cmp_prereleases and cmp_prerelease (further down) are no longer used
+# by SemverThing comparisons, which all go through the sort key (see compute_prerelease_key
+# and SemverThing._build_key); they're kept for backwards compatibility.  Despite the names,
+# the rec_cmp_* pair walk the lists in a plain loop.
+
 def rec_cmp_releases(one, two):
-    """Recursive function that compares two version strings represented as lists
-    to determine which one comes "after" / takes precedence, or if they are equivalent.
+    """Compares two version strings represented as lists to determine which one
+    comes "after" / takes precedence, or if they are equivalent.
 
     List items must be integers (will throw TypeError otherwise).
 
@@ -53,26 +126,21 @@ def rec_cmp_releases(one, two):
     :returns: code in (0, 1, 2)
     :rtype: int
     """
-    # we've exhausted all three levels of comparison, so logically we're at equivalence.
-    if len(one)==0:
-        return 0
-
-    top1 = one[0]
-    top2 = two[0]
+    for top1, top2 in zip(one, two):
+        if top1 > top2:
+            return 1
+        elif top1 < top2:
+            return 2
 
-    if top1 > top2:
-        return 1
-    elif top1 < top2:
-        return 2
-    else:
-        return rec_cmp_releases(one[1:], two[1:])
+    # we've exhausted all three levels of comparison, so logically we're at equivalence.
+    return 0
 
 
 def rec_cmp_prereleases(one, two):
-    """Recursive function that compares two version strings represented as lists
-    to determine which takes precedence.  If it is the left argument ("one"), the 
-    result will be a 1.  If the righthand argument wins ("two"), the result will be
-    a 2.  If the two are equivalent (i.e. are the same string), the result is a 0.
+    """Compares two version strings represented as lists to determine which takes
+    precedence.  If it is the left argument ("one"), the result will be a 1.  If the
+    righthand argument wins ("two"), the result will be a 2.  If the two are equivalent
+    (i.e. are the same string), the result is a 0.
 
     :param one: left-hand version str
     :param two: right-hand version str
@@ -82,89 +150,142 @@ def rec_cmp_prereleases(one, two):
     if one == two:
         return 0
 
+    for item1, item2 in zip(one, two):
+        # numbers become ints; anything else is ASCII.  (checked up front rather than
+        # by letting int() fail, as the exception is costly on every alphanumeric identifier.)
+        int1 = int(item1) if item1.isdecimal() else None
+        int2 = int(item2) if item2.isdecimal() else None
+
+        if int1 is None and int2 is None:
+            # if the two strings are equivalent, move on to the next pair.
+            # if not, declare a winner by ASCII value.
+            if item1 != item2:
+                return 1 if item1 > item2 else 2
+
+        elif int1 is not None and int2 is not None:
+            # if the two integers are equivalent, move on to the next pair.
+            # otherwise, declare a winner by integer value.
+            if int1 != int2:
+                return 1 if int1 > int2 else 2
+
+        else:
+            # Apples and oranges: ASCII always wins.
+            return 1 if int1 is None else 2
+
     # if either has reached its zenith of productivity, the other has won.
     #
     # (Note that this is only correct in the context of there being conditionals in
     #  the cmp_prerelease function that already handle the case in which one 
-    #  version string has a prerelease and the other one doesn't!  This recursive
+    #  version string has a prerelease and the other one doesn't!  This
     #  comparator function won't ever be invoked in that situation.) 
-    if len(one) == 0:
-        return 2
-    elif len(two) == 0:
-        return 1
+    if len(one) == len(two):
+        return 0
+    return 1 if len(one) > len(two) else 2
 
-    # ok so we still have two values to compare.
-    # try to make ints; if we fail, then we have ASCII.
-    cmp_strs = {}
-    cmp_ints = {}
-    try:
-        cmp_ints[1] = int(one[0])
-    except ValueError:
-        cmp_strs[1] = one[0]
 
-    try:
-        cmp_ints[2] = int(two[0])
-    except ValueError:
-        cmp_strs[2] = two[0]
-
-    if len(cmp_strs)==2:
-        # if the two strings are equivalent, recurse down further.
-        # if not, declare a winner by ASCII value.
-        if cmp_strs[1] == cmp_strs[2]:
-            return rec_cmp_prereleases(one[1:], two[1:])
-        elif cmp_strs[1] > cmp_strs[2]:
-            return 1
-        elif cmp_strs[1] < cmp_strs[2]:
-            return 2
+def compute_prerelease_key(prerelease):
+    """Converts a prerelease string into a tuple that sorts the way prereleases should.
 
-    elif len(cmp_ints)==2:
-        # if the two integers are equivalent, recurse down further.
-        # otherwise, declare a winner by integer value. 
-        if cmp_ints[1] == cmp_ints[2]:
-            return rec_cmp_prereleases(one[1:], two[1:])
-        elif cmp_ints[1] > cmp_ints[2]:
-            return 1
-        elif cmp_ints[1] < cmp_ints[2]:
-            return 2
+    As in cmp_prerelease, dashes are treated like dots, so "alpha-11" is split into the
+    identifiers "alpha" and "11".  Each numeric identifier becomes (0, number) and every
+    other identifier becomes (1, text), so numbers compare numerically and always sort
+    below text.  A missing (empty) prerelease gives the empty tuple.
 
-    # Apples and oranges: ASCII always wins.
-    return list(cmp_strs.keys())[0]
+    :param prerelease: prerelease string, e.g. "beta.11" (or empty string / None)
+    :return: comparison key
+    :rtype: tuple
+    """
+    if not prerelease:
+        return ()
+    # (a list comprehension is quicker to turn into a tuple than a generator expression.)
+    return tuple([(0, int(ident)) if ident.isdecimal() else (1, ident)
+                  for ident in prerelease.replace('-', '.').split('.')])
 
 
 def cmp_prerelease(sv1, sv2):
-    """Helper function for comparing the prerelease strings on two SemverThing objects.
+    """Compares the prerelease strings on two SemverThing objects.  (Legacy helper: SemverThing's
+    own comparison operators don't use it.)
 
     Note that if one SV object has NO prerelease string and the other does, the first one with
     the empty string takes precedence.
+
+    The comparison runs on the prerelease keys from compute_prerelease_key.
     
     if sv1 has precedence over sv2, returns the number 1.
     if sv2 has precedence over sv1, returns the number 2.
     if they are equivalent, returns the number 0.
     """
-    if sv1.prerelease == sv2.prerelease:
+    key1 = _prerelease_key_cached(sv1.prerelease)
+    key2 = _prerelease_key_cached(sv2.prerelease)
+
+    if key1 == key2:
         return 0
 
-    if sv1.prerelease and sv2.prerelease:
-        # If we have something like alpha-11 and alpha-2, we want to compare the number field 
-        # as numbers (not ASCII, which would give the wrong answer for that pair).
-        #
-        # Another possiblity is that we're just comparing numbers, e.g. "1-2-3" to "1-2-4"
-        # 
-        # In any case, let's standardize to using dots instead of dashes.
-        pre1 = sv1.prerelease.replace('-', '.')
-        pre2 = sv2.prerelease.replace('-', '.')
-
-        # convert each to a list and then recursively compare the successive strings to each other.
-        return rec_cmp_prereleases(pre1.split('.'), pre2.split('.'))
-                    
-    # if sv1 has a prerelease, and sv2 doesn't, sv2 takes precedence
-    elif sv1.prerelease and not sv2.prerelease:
+    # if sv1 has no prerelease, sv1 takes precedence; if sv2 has none, sv2 does.
+    if not key1:
+        return 1
+    if not key2:
         return 2
 
-    # finally, if sv2 has a prerelease and sv1 doesn't, sv1 takes precedence. 
-    return 1
+    return 1 if key1 > key2 else 2
+
 
+# the same few prereleases ("alpha", "rc.1", ...) turn up across lots of different versions,
+# so their keys are worth remembering too.
+_prerelease_key_cached = lru_cache(maxsize=1024)(compute_prerelease_key)
 
+
+@lru_cache(maxsize=1024)
+def _parse_semver_text_cached(text):
+    """Memoized front end to parse_semver_text used by SemverThing(text).
+
+    Returns the components as a tuple -- immutable, so it's safe to share between every
+    SemverThing built from the same text:
+
+        (major, minor, patch, prerelease, buildmetadata)
+
+    If the text doesn't parse, the NotSemanticVersion error message is returned instead
+    so that repeated bad strings are turned away by the cache as well.  (Just the message:
+    a cached exception would keep its traceback, and every frame in it, alive.)
+
+    :param text: (str)
+    :return: parsed components, or the parsing error message
+    :rtype: tuple or str
+    """
+    try:
+        return _components(parse_semver_text(text))
+    except NotSemanticVersion as err:
+        return err.args[0]
+
+
+@lru_cache(maxsize=4096)
+def _from_string_cached(cls, text):
+    """Memoized body of SemverThing.from_string (text has already been checked to be a
+    non-empty str).
+
+    The version is built straight from parse_semver_text rather than through SemverThing(text),
+    so a miss here doesn't also pay for a lookup and insert in _parse_semver_text_cached.
+    """
+    sv = cls.__new__(cls)
+    sv._assign_parsed(_components(parse_semver_text(text)))
+    return sv
+
+
+def _components(parsed):
+    """Converts the output of parse_semver_text (or a re_semver match's groupdict, once
+    its numbers are converted) into the tuple of components SemverThing is built from.
+
+    The prerelease and buildmetadata strings are interned: the same few ("alpha", "rc.1",
+    ...) turn up across lots of different versions, so they're all kept as one object each.
+    """
+    prerelease = parsed['prerelease']
+    prerelease = sys.intern(prerelease) if prerelease else ''
+    buildmetadata = parsed['buildmetadata']
+    buildmetadata = sys.intern(buildmetadata) if buildmetadata else ''
+    return (parsed['major'], parsed['minor'], parsed['patch'], prerelease, buildmetadata)
+
+
+@total_ordering
 class SemverThing(object):
     """ You can build a SemverThing in three ways:
 
@@ -221,25 +342,109 @@ class SemverThing(object):
 
     """
 
+    # slots keep instances small and attribute access quick; there's no per-instance __dict__.
+    __slots__ = ('_major', '_minor', '_patch', '_prerelease', '_buildmetadata',
+                 '_sort_key', '_hash', '_str_cache')
+
     def __init__(self, text=None, **kwargs):
         """ text argument overrides use of kwargs. """
 
         if text: 
-            try:
-                kwargs = parse_semver_text(text)
-            except TypeError:
-                # attempt to create SemverThing using number or other nonsense.
+            # attempt to create SemverThing using number or other nonsense.
+            if not isinstance(text, str):
                 raise NotSemanticVersion('{} is not a valid string.'.format(text))
 
+            parsed = _parse_semver_text_cached(text)
+            if isinstance(parsed, str):
+                raise NotSemanticVersion(parsed)
+            self._assign_parsed(parsed)
+            return
+
+        self._major = self._minor = self._patch = None
         self.major = kwargs.get('major', None)
         self.minor = kwargs.get('minor', None)
         self.patch = kwargs.get('patch', None)
         self.prerelease = kwargs.get('prerelease', '')
         self.buildmetadata = kwargs.get('buildmetadata', '')
 
+    @classmethod
+    def from_string(cls, text):
+        """Returns a SemverThing parsed from text, reusing a previously parsed one if
+        the same text has been seen recently.
+
+        Since the same object is handed out to every caller asking for the same text,
+        treat it as read-only -- use clone() to get a copy that's safe to modify.
+
+        :param text: version string (plain text)
+        :return: parsed version
+        :rtype: SemverThing
+        :raises: NotSemanticVersion
+        """
+        # checked before the cache is consulted, as it'd choke on unhashable arguments;
+        # and SemverThing() with empty text would hand back a blank slate rather than a version.
+        if not isinstance(text, str):
+            raise NotSemanticVersion('{} is not a valid string.'.format(text))
+        if not text:
+            raise NotSemanticVersion('{!r} is not a version string.'.format(text))
+        return _from_string_cached(cls, text)
+
+    @classmethod
+    def parse_many(cls, texts):
+        """Generates a SemverThing for each of the supplied version strings, in order.
+
+        Rather than parsing the strings one at a time, the whole batch is joined up with
+        newlines and validated by a single pass of the regular expression, which is handy
+        for big batches (e.g. every version in a lockfile).
+
+        Raises NotSemanticVersion upon reaching the first string that isn't a valid version.
+
+        :param texts: iterable of version strings (plain text)
+        :return: parsed versions
+        :rtype: generator of SemverThing
+        :raises: NotSemanticVersion
+        """
+        texts = list(texts)
+        for text in texts:
+            if not isinstance(text, str):
+                raise NotSemanticVersion('{} is not a valid string.'.format(text))
+
+        matches = re_semver_lines.finditer('\n'.join(texts))
+        pos = 0
+        for text in texts:
+            # each string must be matched in full, right where it sits in the batch; an invalid
+            # one is skipped over by finditer, so the next match won't start in the right place.
+            res = next(matches, None) if len(text) <= MAX_LENGTH else None
+            if res is None or res.start() != pos or res.end() != pos + len(text):
+                raise NotSemanticVersion('Supplied text "{}" did not pass regular expression parsing.'.format(text))
+            pos = res.end() + 1
+
+            parsed = res.groupdict()
+            parsed['major'] = int(parsed['major'])
+            parsed['minor'] = int(parsed['minor'])
+            parsed['patch'] = int(parsed['patch'])
+
+            sv = cls.__new__(cls)
+            sv._assign_parsed(_components(parsed))
+            yield sv
+
+    def clone(self):
+        "Returns a new SemverThing with the same attributes as this one."
+        return type(self)(**self.to_dict())
+
+    def _assign_parsed(self, parsed):
+        """Fills in this object from a tuple of parsed components (see _components).
+
+        The parser has already vouched for (and converted) every component, so they're
+        written straight into the private attributes rather than going through the
+        property setters.
+        """
+        self._major, self._minor, self._patch, self._prerelease, self._buildmetadata = parsed
+        self._str_cache = self._sort_key = self._hash = None
+
     # MAGIC PROPERTIES for the numerical attributes:
     #   1) convert input to integer (raise ValueError if not convertible to int)
     #   2) allow setting properties to None without error.
+    #   3) throw away the cached sort key, to be rebuilt when next needed.
 
     @property
     def major(self):
@@ -247,10 +452,9 @@ class SemverThing(object):
 
     @major.setter
     def major(self, value):
-        if value is None:
-            self._major = None
-            return
-        self._major = int(value)
+        self._str_cache = None
+        self._major = None if value is None else int(value)
+        self._clear_key()
 
     @property
     def minor(self):
@@ -258,10 +462,9 @@ class SemverThing(object):
 
     @minor.setter
     def minor(self, value):
-        if value is None:
-            self._minor = None 
-            return 
-        self._minor = int(value)
+        self._str_cache = None
+        self._minor = None if value is None else int(value)
+        self._clear_key()
 
     @property
     def patch(self):
@@ -269,86 +472,110 @@ class SemverThing(object):
 
     @patch.setter
     def patch(self, value):
-        if value is None:
-            self._patch = None
-            return
-        self._patch = int(value)
+        self._str_cache = None
+        self._patch = None if value is None else int(value)
+        self._clear_key()
 
+    # prerelease feeds into the sort key too, so reassigning it throws that away as well.
 
-    # COMPARISON OPERATOR DEFINTIIONS: 
-    #           The left-hand object in the statement is "self"; the right-hand is "other".
-    #           In cmp_* functions these map to one (1) and two (2) respectively.
+    @property
+    def prerelease(self):
+        return self._prerelease
 
-    # <
-    def __lt__(self, other):
-        conditions = {0: False,
-                      1: False,
-                      2: True
-                     }
+    @prerelease.setter
+    def prerelease(self, value):
+        self._str_cache = None
+        self._prerelease = value
+        self._clear_key()
 
-        result = rec_cmp_releases([self.major, self.minor, self.patch],
-                                  [other.major, other.minor, other.patch])
+    # buildmetadata plays no part in comparisons; it's a property only so that
+    # reassigning it resets the cached string form.
 
-        if result in (1,2): 
-            return conditions[result]
+    @property
+    def buildmetadata(self):
+        return self._buildmetadata
 
-        # equivalence? drill down into prerelease.
-        return conditions[cmp_prerelease(self, other)]
+    @buildmetadata.setter
+    def buildmetadata(self, value):
+        self._str_cache = None
+        self._buildmetadata = value
 
-    # <=
-    def __le__(self, other):
-        if self.__eq__(other):
-            return True
 
-        if self.__lt__(other):
-            return True
+    def _clear_key(self):
+        "Throws away the cached sort key and hash, after one of their components has changed."
+        self._sort_key = self._hash = None
 
-        return False
+    def _build_key(self):
+        """Builds (and caches) the tuple that all comparisons between SemverThings are made on:
 
-    # >
-    def __gt__(self, other):
-        conditions = {0: False,
-                      2: False,
-                      1: True
-                     }
+            (major, minor, patch, 1 if there's no prerelease else 0, prerelease key)
 
-        result = rec_cmp_releases([self.major, self.minor, self.patch],
-                                  [other.major, other.minor, other.patch])
+        so that a version without a prerelease sorts after the same version with one.
+        buildmetadata is left out, as it plays no part in precedence.
 
-        if result in (1,2): 
-            return conditions[result]
+        This is put off until the version is first compared, hashed or sorted, so that
+        versions which never are (most of those parsed by the "semver" tool, say) don't
+        pay for it.  Returns None while any of the version numbers is unset, as such a
+        version can't be compared.
+        """
+        if self._major is None or self._minor is None or self._patch is None:
+            return None
+        pre_key = _prerelease_key_cached(self._prerelease) if self._prerelease else ()
+        key = self._sort_key = (self._major, self._minor, self._patch, 0 if pre_key else 1, pre_key)
+        return key
 
-        # equivalence? drill down into prerelease.
-        return conditions[cmp_prerelease(self, other)]
+    @property
+    def sort_key(self):
+        """The tuple SemverThings are compared on; sorting by it orders versions by precedence.
+        (None while any of the version numbers is unset.)"""
+        return self._sort_key or self._build_key()
 
-    # >=
-    def __ge__(self, other):
-        if self.__eq__(other):
-            return True
+    def _incomparable(self, other):
+        "Returns the TypeError raised when comparing against a version that's missing a number."
+        return TypeError('Cannot compare {!r} with {!r}: missing a major, minor or patch number.'.format(self, other))
 
-        if self.__gt__(other):
-            return True
+    # COMPARISON OPERATOR DEFINTIIONS: 
+    #           The left-hand object in the statement is "self"; the right-hand is "other".
+    #           Each one is a single comparison of the (cached) sort keys.
+    #
+    #           Only < and == are spelled out; total_ordering supplies <=, >, >= and !=.
+    #           Comparing against anything that isn't a SemverThing returns NotImplemented,
+    #           so == gives False and ordering raises TypeError instead of an AttributeError.
 
-        return False
+    # <
+    def __lt__(self, other):
+        if not isinstance(other, SemverThing):
+            return NotImplemented
+
+        key1 = self._sort_key or self._build_key()
+        key2 = other._sort_key or other._build_key()
+        if key1 is None or key2 is None:
+            raise self._incomparable(other)
+        return key1 < key2
 
     # ==
     def __eq__(self, other):
-        conditions = {0: True,
-                      1: False,
-                      2: False,   
-                     }
-
-        # if the result is anything other than 0, these are not equivalent releases.
-        if rec_cmp_releases([self.major, self.minor, self.patch],
-                            [other.major, other.minor, other.patch]):
-            return False
-
-        # OK let's check the prereleases.
-        return conditions[cmp_prerelease(self, other)]
-
-    # !=
-    def __ne__(self, other):
-        return not(self.__eq__(other))
+        if self is other:
+            return True
+        if not isinstance(other, SemverThing):
+            return NotImplemented
+
+        key1 = self._sort_key or self._build_key()
+        key2 = other._sort_key or other._build_key()
+        if key1 is None or key2 is None:
+            raise self._incomparable(other)
+        return key1 == key2
+
+    def __hash__(self):
+        # hashes agree with ==, since both come from the sort key (so buildmetadata is ignored).
+        # Don't modify a SemverThing while it's in a set or used as a dict key!
+        h = self._hash
+        if h is None:
+            key = self._sort_key or self._build_key()
+            if key is None:
+                raise TypeError('Cannot hash {!r}: missing a major, minor or patch number.'.format(self))
+            h = self._hash = hash(key)
+        return h
 
     # OBJECT REPRESENTATION FUNCTIONS: to_dict, to_list, __str__, __repr__
 
@@ -362,15 +589,37 @@ class SemverThing(object):
                }
 
     def __str__(self):
-        out = '{major}.{minor}.{patch}'
-        if self.prerelease and self.buildmetadata:
-            out += '-{prerelease}+{buildmetadata}'
-        elif self.prerelease:
-            out += '-{prerelease}'
-        elif self.buildmetadata:
-            out += '+{buildmetadata}'
-        return out.format(**self.to_dict())
+        # SemverThings tend to be long-lived (and shared, when cached), so the string
+        # form is built once and kept until one of the components is reassigned.
+        if self._str_cache is not None:
+            return self._str_cache
+
+        out = f'{self._major}.{self._minor}.{self._patch}'
+        if self._prerelease:
+            out += '-' + self._prerelease
+        if self._buildmetadata:
+            out += '+' + self._buildmetadata
+        self._str_cache = out
+        return out
 
     def __repr__(self):
         return '<SemverThing {}>'.format(str(self))
 
+
+# key function for sort_semvers.  (sorted() calls it just once per item, so the property
+# lookup -- and building any key that isn't cached yet -- isn't repeated per comparison.)
+_get_sort_key = attrgetter('sort_key')
+
+
+def sort_semvers(semvers, reverse=False):
+    """Returns a new list of the supplied SemverThings, sorted from lowest to highest precedence.
+
+    This sorts on each version's sort key, so all the comparisons happen between
+    plain tuples rather than through SemverThing.__lt__ -- much quicker for long lists.
+
+    :param semvers: iterable of SemverThing objects
+    :param reverse: sort from highest to lowest instead (bool)
+    :return: sorted versions
+    :rtype: list
+    """
+    return sorted(semvers, key=_get_sort_key, reverse=reverse)
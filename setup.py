@@ -13,9 +13,15 @@ setup (
        setup_requires = [
             # add things here to force installation ahead of stuff in install_requires
             ],
+       python_requires = '>=3.7',
        install_requires = [
             'docopt',       #for happy docstring/CLI-option marriage.
-            'ipython',      #interactive consoles
-            'pytest',       #test harness
             ],
+       extras_require = {
+            # pip install -e .[dev]
+            'dev': [
+                'ipython',      #interactive consoles
+                'pytest',       #test harness
+                ],
+            },
      )
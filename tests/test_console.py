@@ -1,6 +1,12 @@
-from unittest import TestCase
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase, mock
 
-from semver.console import compare_versions
+from semver import SemverThing
+from semver import console
+from semver.console import compare_versions, compare_line
 
 
 # fixtures
@@ -22,7 +28,8 @@ EXPECT_AFTER = [('3.3.4', '2.3.4'),
 
 EXPECT_EQUAL = [('1.2.3', '1.2.3'),
                 ('1.2.3+test', '1.2.3'),
-                ('1.2.3+thing1', '1.2.3+thing2')
+                ('1.2.3+thing1', '1.2.3+thing2'),
+                ('1.2.3-alpha.1', '1.2.3-alpha.1'),
                ]
 
 EXPECT_INVALID = [('1.1.2', '1.1'),
@@ -31,6 +38,10 @@ EXPECT_INVALID = [('1.1.2', '1.1'),
                   ('1.2+test', '1.2.3'),
                   (None, None),
                   (1.23, 10.2),
+                  ('1.2', '1.2'),
+                  ('', ''),
+                  (['1.2.3'], '1.2.3'),
+                  ({}, {}),
                  ]
 
 GOLD_STANDARD = ('1.0.0-alpha', '1.0.0-alpha.1', '1.0.0-alpha.beta', '1.0.0-beta', 
@@ -69,3 +80,49 @@ class TestSemverConsole(TestCase):
             assert compare_versions(last_item, item) == 'after'
             last_item = item
 
+    def test_compare_line(self):
+        assert compare_line('2.3.4   2.3.5\n') == 'before\n'
+        assert compare_line('1.7.9 1.3.5 0.0.2\n') == 'invalid\n'
+        assert compare_line('1.3.1\n') == 'invalid\n'
+        assert compare_line('   \n') == ''
+
+    def test_usable_cpu_count(self):
+        assert 1 <= console.usable_cpu_count() <= (os.cpu_count() or 1)
+        if hasattr(os, 'sched_getaffinity') and not hasattr(os, 'process_cpu_count'):
+            with mock.patch('os.sched_getaffinity', return_value={0}), \
+                 mock.patch('os.cpu_count', return_value=4):
+                assert console.usable_cpu_count() == 1
+
+    def test_compare_versions_unaffected_by_shared_versions(self):
+        sv = SemverThing.from_string('1.2.3')
+        try:
+            sv.patch = 9
+            assert compare_versions('1.2.3', '1.2.4') == 'before'
+            assert compare_line('1.2.3\t1.2.4') == 'before\n'
+        finally:
+            sv.patch = 3
+
+    def _run_main(self, lines, cpus):
+        "Runs main() over the given input lines (as a file) with the usable CPU count patched; returns its output."
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write(''.join(lines))
+        self.addCleanup(os.remove, f.name)
+
+        out = io.StringIO()
+        with mock.patch('sys.argv', ['semver', f.name]), \
+             mock.patch.object(console, 'usable_cpu_count', return_value=cpus), \
+             mock.patch.object(console, 'PARALLEL_THRESHOLD', 5), \
+             mock.patch.object(console, 'PARALLEL_CHUNKSIZE', 3), \
+             redirect_stdout(out):
+            console.main()
+        return out.getvalue()
+
+    def test_main(self):
+        pairs = (EXPECT_BEFORE + EXPECT_AFTER + EXPECT_EQUAL) * 3
+        lines = ['{} {}\n'.format(*pair) for pair in pairs] + ['\n', '1.2.3\n']
+        answers = [compare_versions(*pair) + '\n' for pair in pairs] + ['invalid\n']
+
+        # more than PARALLEL_THRESHOLD lines, so with 2 CPUs the rest go to the pool.
+        assert self._run_main(lines, cpus=2) == ''.join(answers)
+        assert self._run_main(lines, cpus=1) == ''.join(answers)
+        assert self._run_main(lines[:4], cpus=2) == ''.join(answers[:4])
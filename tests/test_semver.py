@@ -1,11 +1,17 @@
 from unittest import TestCase
 
-from semver import SemverThing, NotSemanticVersion
+from semver import SemverThing, NotSemanticVersion, sort_semvers
+from semver.semver import parse_semver_text
 
 
 semver_correct = ['1.2.3-blah+thing', '1.2.3', '1.2.3-blah', '1.2.3+thing']
 
-semver_wrong = ['2.3-blah', '0.0+test', '234235-prerelease', '425']
+GOLD_STANDARD = ('1.0.0-alpha', '1.0.0-alpha.1', '1.0.0-alpha.beta', '1.0.0-beta',
+                 '1.0.0-beta.2', '1.0.0-beta.11', '1.0.0-rc.1', '1.0.0')
+
+semver_wrong = ['2.3-blah', '0.0+test', '234235-prerelease', '425',
+                '01.2.3', '1.2.3-', '1.2.3+', '1.2.3-01', '1.2.3-alpha..1', '1.2.3+thing$',
+                '.1.2.3', '1.2.3.4-beta', '1.2-3.4', '1.2.3-' + 'a' * 300]
 
 class TestSemverThing(TestCase):
 
@@ -82,3 +88,90 @@ class TestSemverThing(TestCase):
         assert sv_mid3_prerelease != sv_mid2_prerelease2
         assert sv_mid3_prerelease > sv_mid2_prerelease
 
+
+    def test_semver_str(self):
+        "Testing that str() composes the version text, including after attributes are reassigned."
+        for item in semver_correct:
+            assert str(SemverThing(item)) == item
+
+        sv = SemverThing('1.2.3')
+        assert str(sv) == '1.2.3'
+        sv.patch = 4
+        assert str(sv) == '1.2.4'
+        sv.prerelease = 'alpha'
+        assert str(sv) == '1.2.4-alpha'
+        sv.buildmetadata = 'thing'
+        assert str(sv) == '1.2.4-alpha+thing'
+        assert repr(sv) == '<SemverThing 1.2.4-alpha+thing>'
+
+    def test_semver_incomplete_cmp(self):
+        "Testing that comparing a SemverThing with missing version numbers raises TypeError."
+        sv = SemverThing(major=1, minor=2)
+        with self.assertRaises(TypeError):
+            sv < SemverThing('1.2.3')
+        with self.assertRaises(TypeError):
+            sv == SemverThing('1.2.3')
+
+        sv.patch = 3
+        assert sv == SemverThing('1.2.3')
+
+    def test_semver_from_string(self):
+        "Testing that from_string parses (and reuses) versions, and that clone gives a separate copy."
+        sv = SemverThing.from_string('1.2.3-blah+thing')
+        assert sv == SemverThing('1.2.3-blah+thing')
+        assert SemverThing.from_string('1.2.3-blah+thing') is sv
+
+        for item in semver_wrong + ['', None, ['1.2.3'], {}]:
+            with self.assertRaises(NotSemanticVersion):
+                SemverThing.from_string(item)
+
+        copy = sv.clone()
+        assert copy is not sv
+        assert str(copy) == str(sv)
+        copy.patch = 4
+        assert str(sv) == '1.2.3-blah+thing'
+
+    def test_semver_hash(self):
+        "Testing that equal SemverThings hash alike, so they can be deduplicated in sets and dicts."
+        versions = {SemverThing('1.2.3+thing1'), SemverThing('1.2.3+thing2'), SemverThing('1.2.3'),
+                    SemverThing('1.2.3-alpha'), SemverThing('1.2.4')}
+        assert len(versions) == 3
+        assert SemverThing('1.2.4') in versions
+
+        with self.assertRaises(TypeError):
+            hash(SemverThing())
+
+    def test_semver_cmp_other_types(self):
+        "Testing that comparing a SemverThing with a non-SemverThing behaves like other Python objects."
+        sv = SemverThing('1.2.3')
+        assert sv == sv
+        assert sv != '1.2.3'
+        self.assertFalse(sv == None)
+        with self.assertRaises(TypeError):
+            sv < '1.2.4'
+        with self.assertRaises(TypeError):
+            sv >= 1
+
+    def test_parse_semver_text(self):
+        "Testing that parse_semver_text returns integer version numbers and None for missing parts."
+        assert parse_semver_text('1.2.3') == {'major': 1, 'minor': 2, 'patch': 3,
+                                              'prerelease': None, 'buildmetadata': None}
+        assert parse_semver_text('10.0.1-beta.2+thing') == {'major': 10, 'minor': 0, 'patch': 1,
+                                                            'prerelease': 'beta.2', 'buildmetadata': 'thing'}
+
+    def test_sort_semvers(self):
+        "Testing that sort_semvers orders versions the same way the comparison operators do."
+        shuffled = [SemverThing(item) for item in GOLD_STANDARD[::2] + GOLD_STANDARD[1::2]]
+        assert [str(sv) for sv in sort_semvers(shuffled)] == list(GOLD_STANDARD)
+        assert sort_semvers(shuffled) == sorted(shuffled)
+        assert [str(sv) for sv in sort_semvers(shuffled, reverse=True)] == list(GOLD_STANDARD[::-1])
+
+    def test_semver_parse_many(self):
+        "Testing that parse_many parses a batch of strings in order, and stops at a bad one."
+        parsed = list(SemverThing.parse_many(GOLD_STANDARD))
+        assert [str(sv) for sv in parsed] == list(GOLD_STANDARD)
+        assert parsed == [SemverThing(item) for item in GOLD_STANDARD]
+
+        for item in semver_wrong + ['1.2.3\n1.2.4']:
+            with self.assertRaises(NotSemanticVersion):
+                list(SemverThing.parse_many(['1.2.3', item, '1.2.4']))